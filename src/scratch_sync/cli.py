@@ -1,16 +1,26 @@
 """Command-line interface for scratch-sync."""
 
+import configparser
+import functools
+import os
 import re
+import string
 import subprocess
 import sys
+from datetime import datetime, timezone
 from pathlib import Path
 
 import rich_click as click
 from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
 
-from scratch_sync import syncthing, tailscale, discovery, uv
+# discovery is imported lazily inside pair(): it pulls in httpx, which is
+# a noticeable chunk of cold-start time for commands that never probe peers
+from scratch_sync import syncthing, tailscale, uv
+
+try:
+    import pygit2
+except ImportError:
+    pygit2 = None
 
 # Rich console for styled output
 console = Console()
@@ -18,6 +28,26 @@ console = Console()
 # Documentation URL
 DOCS_URL = "https://scratch.tlab.sh"
 
+# Precompiled patterns (avoids re-cache lookups on every call)
+_NONALNUM_RE = re.compile(r"[^a-zA-Z0-9_-]")
+_DASHES_RE = re.compile(r"-+")
+_REPO_URL_RE = re.compile(r"/([^/]+?)(?:\.git)?$")
+
+# Translation table mapping disallowed folder-ID characters to "-"; a direct
+# table lookup per char beats running the regex state machine
+_ALLOWED_CHARS = set(string.ascii_lowercase + string.digits + "_-")
+_SANITIZE_TABLE = str.maketrans(
+    {c: "-" for c in map(chr, range(256)) if c not in _ALLOWED_CHARS}
+)
+
+
+# Install command depends only on the platform, so compute it once at import
+if sys.platform == "win32":
+    _INSTALL_CMD = f"iwr -useb {DOCS_URL}/install.ps1 | iex"
+else:
+    # macOS and Linux
+    _INSTALL_CMD = f"curl -LsSf {DOCS_URL}/install.sh | sh"
+
 
 def get_install_instructions() -> tuple[str, str]:
     """Get OS-appropriate install command and docs URL.
@@ -25,22 +55,18 @@ def get_install_instructions() -> tuple[str, str]:
     Returns:
         Tuple of (install_command, docs_url)
     """
-    if sys.platform == "win32":
-        install_cmd = f"iwr -useb {DOCS_URL}/install.ps1 | iex"
-    else:
-        # macOS and Linux
-        install_cmd = f"curl -LsSf {DOCS_URL}/install.sh | sh"
-    return install_cmd, DOCS_URL
+    return _INSTALL_CMD, DOCS_URL
 
 
 def print_install_instructions() -> None:
     """Print OS-appropriate install instructions with docs link."""
     install_cmd, docs_url = get_install_instructions()
-    console.print()
-    console.print("[bold]To install scratch-sync dependencies:[/]")
-    console.print(f"  [cyan]{install_cmd}[/]")
-    console.print()
-    console.print(f"[dim]For more information, see: {docs_url}[/]")
+    # One print: the markup is parsed and written in a single pass
+    console.print(
+        "\n[bold]To install scratch-sync dependencies:[/]\n"
+        f"  [cyan]{install_cmd}[/]\n\n"
+        f"[dim]For more information, see: {docs_url}[/]"
+    )
 
 
 def require_syncthing() -> None:
@@ -52,7 +78,7 @@ def require_syncthing() -> None:
     console.print()
     console.print("[dim]scratch-sync requires Syncthing to sync folders across machines.[/]")
     print_install_instructions()
-    sys.exit(1)
+    raise click.exceptions.Exit(1)
 
 
 def require_tailscale() -> None:
@@ -65,13 +91,13 @@ def require_tailscale() -> None:
         console.print()
         _, docs_url = get_install_instructions()
         console.print(f"[dim]For more information, see: {docs_url}[/]")
-        sys.exit(1)
+        raise click.exceptions.Exit(1)
 
     if not tailscale.is_tailscale_running():
         console.print("[red]Error:[/] Tailscale is not running.")
         console.print()
         console.print("[dim]Start Tailscale and ensure you're connected to your tailnet.[/]")
-        sys.exit(1)
+        raise click.exceptions.Exit(1)
 
 # Configure rich-click styling
 click.rich_click.THEME = "nord-modern"
@@ -138,53 +164,128 @@ dist/
 *.log
 """
 
+# Encoded once at import; also sidesteps locale-dependent encoding on write
+_STIGNORE_BYTES = STIGNORE_TEMPLATE.encode("utf-8")
 
-def get_repo_name(path: Path | None = None) -> str | None:
-    """Get the repository name from git remote or directory name."""
-    if path is None:
-        path = Path.cwd()
+# Entry appended to (or used to create) .gitignore, pre-encoded like the
+# .stignore template so writes never depend on the locale encoding
+_GITIGNORE_ENTRY = b"# Local scratch folder (synced via scratch-sync)\nscratch/\n"
 
-    # Try to find .git directory
-    git_dir = path / ".git"
-    if not git_dir.exists():
-        # Walk up
-        for parent in path.parents:
-            git_dir = parent / ".git"
-            if git_dir.exists():
-                path = parent
-                break
-        else:
+# Template parsed once at import so callers that need to match against the
+# default ignore patterns don't re-parse it per call
+STIGNORE_PATTERNS = tuple(
+    line for line in STIGNORE_TEMPLATE.splitlines() if line and not line.startswith("//")
+)
+
+
+def _repo_name_from_url(url: str) -> str | None:
+    """Extract the repository name from a git remote URL.
+
+    git@github.com:user/repo.git -> repo
+    https://github.com/user/repo.git -> repo
+    """
+    # Plain C string ops cover the common forms; the regex stays as fallback
+    tail = url.rstrip("/").rsplit("/", 1)[-1].rsplit(":", 1)[-1]
+    name = tail.removesuffix(".git")
+    if name:
+        return name
+    match = _REPO_URL_RE.search(url)
+    return match.group(1) if match else None
+
+
+@functools.lru_cache(maxsize=32)
+def _git_root(path: Path) -> Path | None:
+    """Find the git repository root for a path (cached per resolved path)."""
+    # Walk up with plain string paths: one stat per level, no subprocess and
+    # no intermediate Path allocations. Combined with the .git/config parse
+    # in _remote_url, the common path never forks git at all.
+    cur = os.fspath(path)
+    while True:
+        if os.path.exists(os.path.join(cur, ".git")):
+            return Path(cur)
+        parent = os.path.dirname(cur)
+        if parent == cur:
             return None
+        cur = parent
+
 
-    # Try to get remote origin
+@functools.lru_cache(maxsize=32)
+def _remote_url(git_root: Path) -> str | None:
+    """Get remote.origin.url for a repository root (cached per root)."""
+    # Read .git/config directly (INI format) — no subprocess. For worktrees
+    # and submodules .git is a file pointing at the real git dir.
+    try:
+        git_entry = git_root / ".git"
+        if git_entry.is_file():
+            gitdir = git_entry.read_text().splitlines()[0].removeprefix("gitdir:").strip()
+            git_dir = Path(os.path.normpath(os.path.join(git_root, gitdir)))
+        else:
+            git_dir = git_entry
+        parser = configparser.ConfigParser(strict=False)
+        parser.read(git_dir / "config")
+        return parser['remote "origin"']["url"]
+    except (KeyError, IndexError, configparser.Error, OSError):
+        pass
+
+    # Fall back to asking git itself (e.g. worktree configs, includes)
     try:
         result = subprocess.run(
-            ["git", "remote", "get-url", "origin"],
+            ["git", "-C", str(git_root), "remote", "get-url", "origin"],
             capture_output=True,
             text=True,
-            cwd=path,
         )
         if result.returncode == 0:
-            url = result.stdout.strip()
-            # Extract repo name from URL
-            # git@github.com:user/repo.git -> repo
-            # https://github.com/user/repo.git -> repo
-            match = re.search(r"/([^/]+?)(?:\.git)?$", url)
-            if match:
-                return match.group(1)
+            return result.stdout.strip()
     except Exception:
         pass
+    return None
+
+
+def get_repo_name(path: Path | None = None) -> str | None:
+    """Get the repository name from git remote or directory name."""
+    if path is None:
+        path = Path.cwd()
+
+    # Fast path: in-process repo discovery, no subprocess or per-ancestor stats
+    if pygit2 is not None:
+        repo_path = pygit2.discover_repository(str(path))
+        if repo_path is None:
+            return None
+        repo = pygit2.Repository(repo_path)
+        try:
+            url = repo.remotes["origin"].url
+        except KeyError:
+            url = None
+        if url:
+            name = _repo_name_from_url(url)
+            if name:
+                return name
+        return Path(repo.workdir or repo_path).name
+
+    # Resolve once so equivalent paths hit the same cache entry
+    root = _git_root(path.resolve())
+    if root is None:
+        return None
+
+    url = _remote_url(root)
+    if url:
+        name = _repo_name_from_url(url)
+        if name:
+            return name
 
     # Fall back to directory name
-    return path.name
+    return root.name
 
 
 def sanitize_folder_id(name: str) -> str:
     """Sanitize a name for use as a Syncthing folder ID."""
     # Replace problematic characters
-    sanitized = re.sub(r"[^a-zA-Z0-9_-]", "-", name.lower())
+    sanitized = name.lower().translate(_SANITIZE_TABLE)
+    if not sanitized.isascii():
+        # Table only covers latin-1; fall back to the regex for the rest
+        sanitized = _NONALNUM_RE.sub("-", sanitized)
     # Remove consecutive hyphens
-    sanitized = re.sub(r"-+", "-", sanitized)
+    sanitized = _DASHES_RE.sub("-", sanitized)
     # Remove leading/trailing hyphens
     return sanitized.strip("-")
 
@@ -255,41 +356,60 @@ def init(path: Path | None, name: str | None):
     if syncthing.folder_exists(folder_id):
         console.print(f"[yellow]Warning:[/] Folder [cyan]{folder_id}[/] already exists in Syncthing config.")
         console.print(f"[dim]To remove: syncthing cli config folders remove --id {folder_id}[/]")
-        sys.exit(1)
+        raise click.exceptions.Exit(1)
 
-    # Add folder
+    # Add folder (resolve once — realpath walks every path component)
+    resolved_scratch = scratch_path.resolve()
     console.print("[bold]Adding folder to Syncthing:[/]")
     console.print(f"  [dim]ID:[/]   [cyan]{folder_id}[/]")
-    console.print(f"  [dim]Path:[/] [cyan]{scratch_path.resolve()}[/]")
+    console.print(f"  [dim]Path:[/] [cyan]{resolved_scratch}[/]")
 
-    if not syncthing.add_folder(folder_id, scratch_path.resolve()):
+    if not syncthing.add_folder(folder_id, resolved_scratch):
         console.print("[red]Failed to add folder[/]")
-        sys.exit(1)
+        raise click.exceptions.Exit(1)
 
-    # Add all known devices to this folder
+    # Add all known devices to this folder (single config update)
     local_device_id = syncthing.get_device_id()
-    for device_id in syncthing.list_devices():
-        if device_id != local_device_id:
-            syncthing.add_device_to_folder(folder_id, device_id)
+    other_devices = [d for d in syncthing.list_devices() if d != local_device_id]
+    if other_devices:
+        syncthing.add_devices_to_folder(folder_id, other_devices)
+        for device_id in other_devices:
             console.print(f"  [green]Added device:[/] [dim]{device_id[:7]}...[/]")
 
     # Create .stignore if it doesn't exist
     stignore_path = scratch_path / ".stignore"
     if not stignore_path.exists():
         console.print("[cyan]Creating[/] default .stignore...")
-        stignore_path.write_text(STIGNORE_TEMPLATE)
+        stignore_path.write_bytes(_STIGNORE_BYTES)
 
     # Ensure scratch is in .gitignore
     gitignore_path = path / ".gitignore"
     if gitignore_path.exists():
-        content = gitignore_path.read_text()
-        if "scratch/" not in content and "/scratch" not in content:
+        # Scan line by line and short-circuit on the first hit; the old
+        # substring check loaded the whole file and also matched comments
+        # like "# scratch/"
+        needs_add = True
+        with open(gitignore_path) as f:
+            for line in f:
+                entry = line.strip()
+                if entry in ("scratch", "scratch/", "/scratch", "/scratch/"):
+                    needs_add = False
+                    break
+        if needs_add:
             console.print("[cyan]Adding[/] scratch/ to .gitignore...")
-            with open(gitignore_path, "a") as f:
-                f.write("\n# Local scratch folder (synced via scratch-sync)\nscratch/\n")
+            # Single open/write/close, no TextIOWrapper; O_CLOEXEC keeps the
+            # descriptor out of any spawned subprocesses (absent on Windows)
+            fd = os.open(
+                gitignore_path,
+                os.O_WRONLY | os.O_APPEND | getattr(os, "O_CLOEXEC", 0),
+            )
+            try:
+                os.write(fd, b"\n" + _GITIGNORE_ENTRY)
+            finally:
+                os.close(fd)
     else:
         console.print("[cyan]Creating[/] .gitignore with scratch/...")
-        gitignore_path.write_text("# Local scratch folder (synced via scratch-sync)\nscratch/\n")
+        gitignore_path.write_bytes(_GITIGNORE_ENTRY)
 
     # Configure GUI binding for remote discovery
     if syncthing.is_gui_localhost_only():
@@ -313,6 +433,8 @@ def init(path: Path | None, name: str | None):
 
 def _print_discovery_troubleshooting(failed_peers: list) -> None:
     """Print troubleshooting tips based on discovery failures."""
+    from scratch_sync import discovery
+
     # Categorize failures
     refused = []
     timeouts = []
@@ -326,37 +448,43 @@ def _print_discovery_troubleshooting(failed_peers: list) -> None:
         else:
             other.append(peer)
 
-    console.print("[bold]Troubleshooting:[/]")
+    # Build each section as a list of lines and print once — one markup
+    # parse and one write instead of a dozen
+    lines = ["[bold]Troubleshooting:[/]"]
 
     if refused:
-        console.print()
-        console.print(f"  [yellow]Not listening[/] on {len(refused)} peer(s):")
-        for peer in refused:
-            console.print(f"    • {peer.hostname}")
-        console.print()
-        console.print("  [dim]This means port 8384 is not open. Possible causes:[/]")
-        console.print("    • Syncthing not installed")
-        console.print("    • Syncthing not running")
-        console.print("    • Syncthing GUI bound to localhost only")
-        console.print()
-        console.print("  [dim]On those machines, install/start Syncthing and run:[/]")
-        console.print("    [cyan]scratch-sync init[/]")
+        lines += ["", f"  [yellow]Not listening[/] on {len(refused)} peer(s):"]
+        lines += [f"    • {peer.hostname}" for peer in refused]
+        lines += [
+            "",
+            "  [dim]This means port 8384 is not open. Possible causes:[/]",
+            "    • Syncthing not installed",
+            "    • Syncthing not running",
+            "    • Syncthing GUI bound to localhost only",
+            "",
+            "  [dim]On those machines, install/start Syncthing and run:[/]",
+            "    [cyan]scratch-sync init[/]",
+        ]
 
     if timeouts:
-        console.print()
-        console.print(f"  [dim]Timeout[/] on {len(timeouts)} peer(s):")
-        for peer in timeouts:
-            console.print(f"    • {peer.hostname}")
-        console.print()
-        console.print("  [dim]This could mean:[/]")
-        console.print("    • Syncthing is not running")
-        console.print("    • Firewall blocking port 8384")
-        console.print("    • Network connectivity issues")
+        lines += ["", f"  [dim]Timeout[/] on {len(timeouts)} peer(s):"]
+        lines += [f"    • {peer.hostname}" for peer in timeouts]
+        lines += [
+            "",
+            "  [dim]This could mean:[/]",
+            "    • Syncthing is not running",
+            "    • Firewall blocking port 8384",
+            "    • Network connectivity issues",
+        ]
 
     if other and not refused and not timeouts:
-        console.print()
-        console.print("  • Ensure Syncthing is running on other devices")
-        console.print("  • Run [cyan]scratch-sync init[/] on other devices to configure GUI binding")
+        lines += [
+            "",
+            "  • Ensure Syncthing is running on other devices",
+            "  • Run [cyan]scratch-sync init[/] on other devices to configure GUI binding",
+        ]
+
+    console.print("\n".join(lines))
 
 
 @main.command()
@@ -373,6 +501,10 @@ def pair(timeout: float, yes: bool):
       • Syncthing must be running on other devices
       • Syncthing GUI must be bound to 0.0.0.0:8384 (run [cyan]scratch-sync init[/] first)
     """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from scratch_sync import discovery
+
     require_tailscale()
     require_syncthing()
 
@@ -388,25 +520,36 @@ def pair(timeout: float, yes: bool):
     console.print(f"Found [bold]{len(peers)}[/] online peer(s)")
     console.print()
 
-    # Try to discover Syncthing on each peer using the noauth endpoint
+    # Try to discover Syncthing on each peer using the noauth endpoint.
+    # Probes run concurrently over one shared connection pool, so wall time
+    # is ~timeout instead of len(peers) * timeout. Each peer's line is
+    # printed as its probe finishes; results are drained in input order.
+    peers_by_ip = {peer.tailscale_ip: peer for peer in peers}
+
+    def _print_probe(ip: str, result: discovery.DiscoveryResult) -> None:
+        peer = peers_by_ip[ip]
+        if result.status == discovery.DiscoveryStatus.SUCCESS:
+            outcome = "[green]found![/]"
+        elif result.status == discovery.DiscoveryStatus.CONNECTION_REFUSED:
+            outcome = "[yellow]not listening[/]"
+        elif result.status == discovery.DiscoveryStatus.TIMEOUT:
+            outcome = "[dim]timeout[/]"
+        else:
+            outcome = "[dim]no Syncthing[/]"
+        console.print(f"  Checking [cyan]{peer.hostname}[/] ({peer.tailscale_ip})... {outcome}")
+
+    results = discovery.discover_syncthing_peers(
+        list(peers_by_ip), timeout=timeout, on_result=_print_probe
+    )
+
     discovered = []
     failed_peers = []  # Track failures for troubleshooting
     for peer in peers:
-        console.print(f"  Checking [cyan]{peer.hostname}[/] ({peer.tailscale_ip})...", end="")
-        result = discovery.discover_syncthing_peer_detailed(peer.tailscale_ip, timeout=timeout)
-
+        result = results[peer.tailscale_ip]
         if result.status == discovery.DiscoveryStatus.SUCCESS:
-            console.print(" [green]found![/]")
             result.peer_info["tailscale_hostname"] = peer.hostname
             discovered.append(result.peer_info)
-        elif result.status == discovery.DiscoveryStatus.CONNECTION_REFUSED:
-            console.print(" [yellow]not listening[/]")
-            failed_peers.append((peer, result))
-        elif result.status == discovery.DiscoveryStatus.TIMEOUT:
-            console.print(" [dim]timeout[/]")
-            failed_peers.append((peer, result))
         else:
-            console.print(" [dim]no Syncthing[/]")
             failed_peers.append((peer, result))
 
     if not discovered:
@@ -459,11 +602,12 @@ def pair(timeout: float, yes: bool):
             console.print("[yellow]No devices selected[/]")
             return
 
-    # Pair with selected devices
+    # Pair with selected devices (fetch the configured-device set once)
+    existing_devices = set(syncthing.list_devices())
     paired_device_ids = []
     for info in selected:
         hostname = info.get("hostname") or info.get("tailscale_hostname")
-        if discovery.auto_pair_with_peer(info):
+        if discovery.auto_pair_with_peer(info, existing_devices):
             console.print(f"  [green]Paired with {hostname}[/]")
             paired_device_ids.append(info.get("syncthing_device_id"))
         else:
@@ -477,10 +621,20 @@ def pair(timeout: float, yes: bool):
         if scratch_folders:
             console.print()
             console.print("[bold]Adding devices to scratch folders...[/]")
+            # All folder sharing entries go out in one full-config PUT
+            device_ids = [d for d in paired_device_ids if d]
+            if not syncthing.apply_config_batch(
+                folder_devices={folder_id: device_ids for folder_id in scratch_folders}
+            ):
+                # Batch PUT failed; fall back to per-folder updates
+                with ThreadPoolExecutor(max_workers=8) as executor:
+                    list(
+                        executor.map(
+                            lambda folder_id: syncthing.add_devices_to_folder(folder_id, device_ids),
+                            scratch_folders,
+                        )
+                    )
             for folder_id in scratch_folders:
-                for device_id in paired_device_ids:
-                    if device_id:
-                        syncthing.add_device_to_folder(folder_id, device_id)
                 console.print(f"  [green]Updated {folder_id}[/]")
 
     console.print()
@@ -500,24 +654,30 @@ def _get_state_style(state: str) -> str:
     return state_styles.get(state, "dim")
 
 
+_BYTE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
+
 def _format_bytes(b: int) -> str:
     """Format bytes to human readable."""
-    for unit in ["B", "KB", "MB", "GB", "TB"]:
-        if abs(b) < 1024.0:
-            return f"{b:.1f} {unit}"
-        b /= 1024.0
-    return f"{b:.1f} PB"
+    if not b:
+        return "0.0 B"
+    # Exponent straight from the bit length: O(1), no division loop
+    i = min((abs(b).bit_length() - 1) // 10, len(_BYTE_UNITS) - 1)
+    return f"{b / 1024**i:.1f} {_BYTE_UNITS[i]}"
 
 
-def _format_time(iso_time: str) -> str:
-    """Format ISO time to relative."""
-    from datetime import datetime
+def _format_time(iso_time: str, now: datetime | None = None) -> str:
+    """Format ISO time to relative.
 
-    if not iso_time or iso_time.startswith("1969") or iso_time.startswith("0001"):
+    Callers formatting many timestamps should compute ``now`` once and pass
+    it in, rather than paying a clock read per call.
+    """
+    if not iso_time or iso_time[:4] in ("1969", "0001"):
         return "never"
     try:
         dt = datetime.fromisoformat(iso_time.replace("Z", "+00:00"))
-        now = datetime.now(dt.tzinfo)
+        if now is None:
+            now = datetime.now(dt.tzinfo)
         diff = now - dt
         if diff.days > 0:
             return f"{diff.days}d ago"
@@ -557,6 +717,11 @@ def status():
       • Paired devices and their connection status
       • All [cyan]scratch-*[/] folders and their sync state
     """
+    # Only status renders tables/panels; import here so the other commands
+    # don't pay for it at startup
+    from rich.panel import Panel
+    from rich.table import Table
+
     # === Dependencies Section ===
     console.print("[bold]Dependencies[/]")
     console.print()
@@ -634,7 +799,7 @@ def status():
         console.print()
         console.print("[dim]scratch-sync requires Syncthing to sync folders across machines.[/]")
         print_install_instructions()
-        sys.exit(1)
+        raise click.exceptions.Exit(1)
 
     if not syncthing.is_syncthing_running():
         console.print()
@@ -694,8 +859,14 @@ def status():
         return
 
     # === This Device Section ===
+    # The remaining reads are independent; the bundle fans them out so the
+    # section renders after the slowest call instead of the sum of all six
+    from concurrent.futures import ThreadPoolExecutor
+
+    bundle = syncthing.fetch_status_bundle()
+
     console.print()
-    system_status = syncthing.get_system_status()
+    system_status = bundle.system_status
 
     if system_status:
         device_id = system_status.get("myID", "unknown")
@@ -725,9 +896,9 @@ def status():
             device_id = None
 
     # Get devices with full info from REST API
-    config_devices = syncthing.get_config_devices()
-    connections = syncthing.get_connections()
-    device_stats = syncthing.get_device_stats()
+    config_devices = bundle.config_devices
+    connections = bundle.connections
+    device_stats = bundle.device_stats
 
     # Filter out self
     my_id = system_status.get("myID", "") if system_status else (device_id or "")
@@ -744,14 +915,17 @@ def status():
         device_table.add_column("Last Seen")
         device_table.add_column("Transfer")
 
-        conn_info = connections.get("connections", {})
+        conn_info = connections.get("connections") or {}
+        now_utc = datetime.now(timezone.utc)
 
+        # Build rows first, then populate the table in one tight loop
+        rows = []
         for device in other_devices:
             dev_id = device.get("deviceID", "")
             name = device.get("name") or "unknown"
 
             # Connection status
-            conn = conn_info.get(dev_id, {})
+            conn = conn_info.get(dev_id) or {}
             if conn.get("connected"):
                 status_str = "[green]connected[/]"
             elif conn.get("paused"):
@@ -761,7 +935,7 @@ def status():
 
             # Stats
             stats = device_stats.get(dev_id, {})
-            last_seen = _format_time(stats.get("lastSeen", ""))
+            last_seen = _format_time(stats.get("lastSeen", ""), now_utc)
 
             # Transfer totals
             in_bytes = conn.get("inBytesTotal", 0)
@@ -771,20 +945,17 @@ def status():
             else:
                 transfer = "[dim]-[/]"
 
-            device_table.add_row(
-                name,
-                f"{dev_id[:15]}...",
-                status_str,
-                last_seen,
-                transfer,
-            )
+            rows.append((name, f"{dev_id[:15]}...", status_str, last_seen, transfer))
+
+        for row in rows:
+            device_table.add_row(*row)
 
         console.print(device_table)
     else:
         console.print("[dim]No devices paired yet. Run: scratch-sync pair[/]")
 
     # Get folders with full info
-    config_folders = syncthing.get_config_folders()
+    config_folders = bundle.config_folders
     scratch_folders = [f for f in config_folders if f.get("id", "").startswith("scratch-")]
 
     console.print()
@@ -797,12 +968,27 @@ def status():
         folder_table.add_column("Status")
         folder_table.add_column("Shared With")
 
+        # Fetch per-folder statuses concurrently — these are independent
+        # REST calls, so M folders cost ~one round-trip instead of M
+        folder_ids = [f.get("id", "unknown") for f in scratch_folders]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            folder_statuses = dict(
+                zip(folder_ids, executor.map(syncthing.get_folder_status, folder_ids))
+            )
+
+        # Index names once for O(1) lookups instead of scanning
+        # config_devices for every shared device of every folder
+        device_name_by_id = {
+            d.get("deviceID"): (d.get("name") or (d.get("deviceID") or "")[:8])
+            for d in config_devices
+        }
+
+        rows = []
         for folder in scratch_folders:
             folder_id = folder.get("id", "unknown")
             path = folder.get("path", "")
 
-            # Get folder status
-            folder_status = syncthing.get_folder_status(folder_id)
+            folder_status = folder_statuses.get(folder_id)
             if folder_status:
                 state = folder_status.get("state", "unknown")
                 style = _get_state_style(state)
@@ -811,34 +997,35 @@ def status():
                 status_str = "[dim]unknown[/]"
 
             # Get devices this folder is shared with
-            shared_devices = folder.get("devices", [])
-            shared_names = []
-            for sd in shared_devices:
-                sd_id = sd.get("deviceID", "")
-                if sd_id == my_id:
-                    continue
-                # Find device name
-                for d in config_devices:
-                    if d.get("deviceID") == sd_id:
-                        shared_names.append(d.get("name") or sd_id[:8])
-                        break
+            shared_names = [
+                device_name_by_id[sd_id]
+                for sd in folder.get("devices", [])
+                if (sd_id := sd.get("deviceID"))
+                and sd_id != my_id
+                and sd_id in device_name_by_id
+            ]
 
             # Truncate path if too long
             display_path = path if len(path) <= 35 else "..." + path[-32:]
 
-            folder_table.add_row(
-                folder_id,
-                f"[dim]{display_path}[/]",
-                status_str,
-                ", ".join(shared_names) if shared_names else "[dim]none[/]",
+            rows.append(
+                (
+                    folder_id,
+                    f"[dim]{display_path}[/]",
+                    status_str,
+                    ", ".join(shared_names) if shared_names else "[dim]none[/]",
+                )
             )
 
+        for row in rows:
+            folder_table.add_row(*row)
+
         console.print(folder_table)
     else:
         console.print("[dim]No scratch folders configured. Run: scratch-sync init[/]")
 
     # Check for pending device requests
-    pending = syncthing.get_pending_devices()
+    pending = bundle.pending_devices
     if pending:
         console.print()
         console.print(f"[bold yellow]Pending Pair Requests ({len(pending)})[/]")
@@ -4,13 +4,56 @@ Uses Syncthing's noauth endpoint to discover device IDs without requiring
 SSH access, API keys, or a custom discovery server.
 """
 
+from __future__ import annotations
+
+import asyncio
+import errno
+import json
+import selectors
+import socket
+import time
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
 from enum import Enum
-
-import httpx
+from pathlib import Path
+from typing import TYPE_CHECKING
 
 from scratch_sync import syncthing
 
+if TYPE_CHECKING:
+    import httpx
+
+# Per-peer RTT estimates (EWMA, seconds) persisted across invocations so
+# repeat probes of known-fast peers don't wait out the full default timeout.
+_RTT_CACHE_PATH = Path.home() / ".cache" / "scratch-sync" / "peer_rtt.json"
+_RTT_EWMA_ALPHA = 0.3
+_MIN_TIMEOUT = 0.5
+
+
+def _load_rtt_cache() -> dict[str, float]:
+    """Load the persisted per-peer RTT estimates (empty on any error)."""
+    try:
+        data = json.loads(_RTT_CACHE_PATH.read_bytes())
+        return {ip: float(rtt) for ip, rtt in data.items()}
+    except (OSError, ValueError, TypeError, AttributeError):
+        return {}
+
+
+def _save_rtt_cache(cache: dict[str, float]) -> None:
+    """Persist RTT estimates; best-effort, failures are ignored."""
+    try:
+        _RTT_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        _RTT_CACHE_PATH.write_text(json.dumps(cache))
+    except OSError:
+        pass
+
+
+def _adaptive_timeout(ewma_rtt: float | None, cap: float) -> float:
+    """Timeout for one peer: 3x its smoothed RTT, clamped to [0.5s, cap]."""
+    if ewma_rtt is None:
+        return cap
+    return min(max(3.0 * ewma_rtt, _MIN_TIMEOUT), cap)
+
 
 class DiscoveryStatus(Enum):
     """Status of a Syncthing discovery attempt."""
@@ -23,7 +66,7 @@ class DiscoveryStatus(Enum):
     UNKNOWN_ERROR = "unknown_error"
 
 
-@dataclass
+@dataclass(slots=True)
 class DiscoveryResult:
     """Result of a Syncthing discovery attempt."""
 
@@ -32,8 +75,104 @@ class DiscoveryResult:
     error_message: str | None = None
 
 
+def _result_from_response(ip: str, response: httpx.Response) -> DiscoveryResult:
+    """Classify a noauth health response into a DiscoveryResult."""
+    if response.status_code == 200:
+        device_id = response.headers.get("X-Syncthing-Id")
+        version = response.headers.get("X-Syncthing-Version", "unknown")
+
+        if device_id:
+            return DiscoveryResult(
+                status=DiscoveryStatus.SUCCESS,
+                peer_info={
+                    "hostname": None,
+                    "tailscale_ip": ip,
+                    "syncthing_device_id": device_id,
+                    "syncthing_version": version,
+                    "syncthing_port": 22000,
+                },
+            )
+        return DiscoveryResult(
+            status=DiscoveryStatus.NO_SYNCTHING_HEADER,
+            error_message="HTTP response received but no X-Syncthing-Id header",
+        )
+    return DiscoveryResult(
+        status=DiscoveryStatus.HTTP_ERROR,
+        error_message=f"HTTP {response.status_code}",
+    )
+
+
+def _result_from_error(error: Exception) -> DiscoveryResult:
+    """Classify a probe exception into a DiscoveryResult."""
+    import httpx
+
+    if isinstance(error, httpx.ConnectError):
+        # The async transport wraps the OS error a few levels deep and its
+        # message doesn't mention "refused", so walk the cause chain too
+        cause: BaseException | None = error
+        for _ in range(5):
+            if cause is None:
+                break
+            if isinstance(cause, ConnectionRefusedError) or "refused" in str(cause).lower():
+                return DiscoveryResult(
+                    status=DiscoveryStatus.CONNECTION_REFUSED,
+                    error_message="Connection refused - Syncthing GUI not listening on this address",
+                )
+            cause = cause.__cause__ or cause.__context__
+        return DiscoveryResult(
+            status=DiscoveryStatus.UNKNOWN_ERROR,
+            error_message=f"Connection error: {error}",
+        )
+    if isinstance(error, httpx.TimeoutException):
+        return DiscoveryResult(
+            status=DiscoveryStatus.TIMEOUT,
+            error_message="Connection timed out",
+        )
+    return DiscoveryResult(
+        status=DiscoveryStatus.UNKNOWN_ERROR,
+        error_message=str(error),
+    )
+
+
+def _tcp_probe(ip: str, port: int, timeout: float) -> DiscoveryStatus | None:
+    """Cheap liveness check: one non-blocking TCP connect, no HTTP stack.
+
+    Returns CONNECTION_REFUSED or TIMEOUT when the port is definitively
+    down, or None when it's open (or the probe is inconclusive) and the
+    full HTTP probe should proceed.
+    """
+    try:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    except OSError:
+        return None
+    try:
+        sock.setblocking(False)
+        err = sock.connect_ex((ip, port))
+        if err == 0:
+            return None
+        if err == errno.ECONNREFUSED:
+            return DiscoveryStatus.CONNECTION_REFUSED
+        if err not in (errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EAGAIN):
+            return None
+        with selectors.DefaultSelector() as selector:
+            selector.register(sock, selectors.EVENT_WRITE)
+            if not selector.select(timeout):
+                return DiscoveryStatus.TIMEOUT
+        err = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+        if err == errno.ECONNREFUSED:
+            return DiscoveryStatus.CONNECTION_REFUSED
+        return None
+    except OSError:
+        return None
+    finally:
+        sock.close()
+
+
 def discover_syncthing_peer_detailed(
-    ip: str, port: int = 8384, timeout: float = 3.0
+    ip: str,
+    port: int = 8384,
+    timeout: float = 3.0,
+    client: httpx.Client | None = None,
 ) -> DiscoveryResult:
     """
     Discover Syncthing device ID from a peer with detailed error reporting.
@@ -42,64 +181,108 @@ def discover_syncthing_peer_detailed(
         ip: The IP address of the peer (e.g., Tailscale IP)
         port: Syncthing GUI port (default 8384)
         timeout: Request timeout in seconds
+        client: Optional shared client; callers probing several peers can
+            pass one to reuse its keep-alive connection pool
 
     Returns:
         DiscoveryResult with status and peer info or error details
     """
-    url = f"http://{ip}:{port}/rest/noauth/health"
-
-    try:
-        with httpx.Client(timeout=timeout) as client:
-            response = client.get(url)
-
-            if response.status_code == 200:
-                device_id = response.headers.get("X-Syncthing-Id")
-                version = response.headers.get("X-Syncthing-Version", "unknown")
-
-                if device_id:
-                    return DiscoveryResult(
-                        status=DiscoveryStatus.SUCCESS,
-                        peer_info={
-                            "hostname": None,
-                            "tailscale_ip": ip,
-                            "syncthing_device_id": device_id,
-                            "syncthing_version": version,
-                            "syncthing_port": 22000,
-                        },
-                    )
-                else:
-                    return DiscoveryResult(
-                        status=DiscoveryStatus.NO_SYNCTHING_HEADER,
-                        error_message="HTTP response received but no X-Syncthing-Id header",
-                    )
-            else:
-                return DiscoveryResult(
-                    status=DiscoveryStatus.HTTP_ERROR,
-                    error_message=f"HTTP {response.status_code}",
-                )
-
-    except httpx.ConnectError as e:
-        error_str = str(e).lower()
-        if "refused" in error_str or "connection refused" in error_str:
-            return DiscoveryResult(
-                status=DiscoveryStatus.CONNECTION_REFUSED,
-                error_message="Connection refused - Syncthing GUI not listening on this address",
-            )
-        else:
-            return DiscoveryResult(
-                status=DiscoveryStatus.UNKNOWN_ERROR,
-                error_message=f"Connection error: {e}",
-            )
-    except httpx.TimeoutException:
+    # Prune dead peers with a raw TCP connect before paying HTTP overhead
+    probe_status = _tcp_probe(ip, port, timeout)
+    if probe_status is DiscoveryStatus.CONNECTION_REFUSED:
+        return DiscoveryResult(
+            status=DiscoveryStatus.CONNECTION_REFUSED,
+            error_message="Connection refused - Syncthing GUI not listening on this address",
+        )
+    if probe_status is DiscoveryStatus.TIMEOUT:
         return DiscoveryResult(
             status=DiscoveryStatus.TIMEOUT,
             error_message="Connection timed out",
         )
+
+    import httpx
+
+    url = f"http://{ip}:{port}/rest/noauth/health"
+
+    try:
+        if client is not None:
+            response = client.get(url, timeout=timeout)
+        else:
+            with httpx.Client(timeout=timeout) as own_client:
+                response = own_client.get(url)
+        return _result_from_response(ip, response)
     except Exception as e:
-        return DiscoveryResult(
-            status=DiscoveryStatus.UNKNOWN_ERROR,
-            error_message=str(e),
-        )
+        return _result_from_error(e)
+
+
+async def _discover_peer_async(
+    client: httpx.AsyncClient, ip: str, port: int, timeout: float
+) -> tuple[DiscoveryResult, float]:
+    """Probe one peer on a shared async client, returning (result, rtt)."""
+    url = f"http://{ip}:{port}/rest/noauth/health"
+    start = time.monotonic()
+    try:
+        response = await client.get(url, timeout=timeout)
+        return _result_from_response(ip, response), time.monotonic() - start
+    except Exception as e:
+        return _result_from_error(e), time.monotonic() - start
+
+
+async def _discover_peers_async(
+    ips: list[str],
+    port: int,
+    timeout: float,
+    on_result: Callable[[str, DiscoveryResult], None] | None,
+) -> dict[str, DiscoveryResult]:
+    import httpx
+
+    rtt_cache = _load_rtt_cache()
+    limits = httpx.Limits(max_keepalive_connections=32)
+    async with httpx.AsyncClient(timeout=timeout, limits=limits) as client:
+
+        async def probe(ip: str) -> tuple[str, DiscoveryResult]:
+            peer_timeout = _adaptive_timeout(rtt_cache.get(ip), timeout)
+            result, rtt = await _discover_peer_async(client, ip, port, peer_timeout)
+            if result.status is DiscoveryStatus.SUCCESS:
+                prev = rtt_cache.get(ip)
+                rtt_cache[ip] = (
+                    rtt if prev is None
+                    else _RTT_EWMA_ALPHA * rtt + (1 - _RTT_EWMA_ALPHA) * prev
+                )
+            if on_result is not None:
+                on_result(ip, result)
+            return ip, result
+
+        pairs = await asyncio.gather(*(probe(ip) for ip in ips))
+    _save_rtt_cache(rtt_cache)
+    return dict(pairs)
+
+
+def discover_syncthing_peers(
+    ips: Sequence[str],
+    port: int = 8384,
+    timeout: float = 3.0,
+    on_result: Callable[[str, DiscoveryResult], None] | None = None,
+) -> dict[str, DiscoveryResult]:
+    """
+    Probe many peers concurrently with a single shared connection pool.
+
+    The probes are pure network I/O, so wall time is roughly one timeout
+    for any number of peers instead of one timeout per peer.
+
+    Args:
+        ips: Peer IP addresses to probe
+        port: Syncthing GUI port (default 8384)
+        timeout: Per-request timeout in seconds
+        on_result: Optional callback invoked with (ip, result) as each
+            probe finishes (useful for progress output)
+
+    Returns:
+        Mapping of IP address to DiscoveryResult
+    """
+    if not ips:
+        return {}
+    return asyncio.run(_discover_peers_async(list(ips), port, timeout, on_result))
 
 
 def discover_syncthing_peer(ip: str, port: int = 8384, timeout: float = 3.0) -> dict | None:
@@ -121,7 +304,7 @@ def discover_syncthing_peer(ip: str, port: int = 8384, timeout: float = 3.0) ->
     return result.peer_info
 
 
-def auto_pair_with_peer(peer_info: dict) -> bool:
+def auto_pair_with_peer(peer_info: dict, existing_devices: set[str] | None = None) -> bool:
     """
     Automatically pair with a discovered peer.
 
@@ -130,6 +313,9 @@ def auto_pair_with_peer(peer_info: dict) -> bool:
 
     Args:
         peer_info: Dictionary with peer information from discover_syncthing_peer()
+        existing_devices: Already-configured device IDs; callers pairing
+            several peers can fetch this once and share it to avoid a
+            config lookup per peer
 
     Returns:
         True if pairing succeeded
@@ -143,17 +329,12 @@ def auto_pair_with_peer(peer_info: dict) -> bool:
         return False
 
     # Check if already added
-    existing_devices = syncthing.list_devices()
+    if existing_devices is None:
+        existing_devices = set(syncthing.list_devices())
     if device_id in existing_devices:
         # Just update address
         syncthing.set_device_address(device_id, f"tcp://{ip}:{port}")
         return True
 
-    # Add new device
-    if not syncthing.add_device(device_id, hostname):
-        return False
-
-    # Set Tailscale address
-    syncthing.set_device_address(device_id, f"tcp://{ip}:{port}")
-
-    return True
+    # Add new device with its Tailscale address in one config update
+    return syncthing.pair_device(device_id, hostname, f"tcp://{ip}:{port}")
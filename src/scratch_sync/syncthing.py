@@ -1,15 +1,52 @@
 """Syncthing CLI and API interactions."""
 
+import functools
+import ipaddress
 import json
 import os
 import shutil
 import subprocess
 import sys
+import threading
+import urllib.parse
+from dataclasses import dataclass
 from pathlib import Path
 
+try:
+    # Optional fast path (install with the "perf" extra); parses bytes
+    # directly and is a few times faster than the stdlib on large payloads
+    import orjson
 
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+# Shared keep-alive client for the local REST API; created lazily so
+# commands that never touch REST don't pay the httpx import
+_api_client = None
+_api_client_lock = threading.Lock()
+
+
+def _get_api_client():
+    """Get the shared HTTP client for the local Syncthing REST API."""
+    global _api_client
+    if _api_client is None:
+        with _api_client_lock:
+            if _api_client is None:
+                import httpx
+
+                _api_client = httpx.Client(timeout=5.0, verify=False, follow_redirects=True)
+    return _api_client
+
+
+@functools.lru_cache(maxsize=1)
 def find_syncthing() -> str | None:
     """Find syncthing binary in common locations."""
+    # Explicit override skips the PATH scan entirely (handy in test harnesses)
+    override = os.environ.get("SCRATCH_SYNC_SYNCTHING_BIN")
+    if override:
+        return override
+
     # Check PATH first (cross-platform)
     binary = shutil.which("syncthing")
     if binary:
@@ -46,12 +83,19 @@ def run_syncthing_cli(*args: str) -> subprocess.CompletedProcess:
     return subprocess.run([binary, "cli", *args], capture_output=True, text=True)
 
 
+@functools.lru_cache(maxsize=1)
 def get_device_id() -> str:
-    """Get the local device ID."""
+    """Get the local device ID (stable per process, so cached)."""
     binary = find_syncthing()
     if not binary:
         raise RuntimeError("Syncthing not installed")
 
+    # When the daemon is up, its status already carries the ID — no
+    # subprocess and no 2.0-vs-legacy flag guessing needed
+    status = get_system_status()
+    if status and status.get("myID"):
+        return status["myID"]
+
     # Syncthing 2.0+ uses subcommand, older uses flag
     result = subprocess.run([binary, "device-id"], capture_output=True, text=True)
     if result.returncode != 0:
@@ -69,25 +113,33 @@ def get_system_info() -> dict:
     if result.returncode != 0:
         raise RuntimeError(f"Failed to get system info: {result.stderr}")
 
-    return json.loads(result.stdout)
+    return _loads(result.stdout)
 
 
 def list_folders() -> list[str]:
     """List all configured folder IDs."""
+    config = get_full_config()
+    if config is not None:
+        return [f.get("id", "") for f in config.get("folders") or []]
+
     result = run_syncthing_cli("config", "folders", "list")
     if result.returncode != 0:
         return []
 
-    return [line.strip() for line in result.stdout.strip().split("\n") if line.strip()]
+    return [line.strip() for line in result.stdout.splitlines() if line.strip()]
 
 
 def list_devices() -> list[str]:
     """List all configured device IDs."""
+    config = get_full_config()
+    if config is not None:
+        return [d.get("deviceID", "") for d in config.get("devices") or []]
+
     result = run_syncthing_cli("config", "devices", "list")
     if result.returncode != 0:
         return []
 
-    return [line.strip() for line in result.stdout.strip().split("\n") if line.strip()]
+    return [line.strip() for line in result.stdout.splitlines() if line.strip()]
 
 
 def folder_exists(folder_id: str) -> bool:
@@ -96,7 +148,20 @@ def folder_exists(folder_id: str) -> bool:
 
 
 def add_folder(folder_id: str, path: Path) -> bool:
-    """Add a folder to Syncthing."""
+    """Add a folder to Syncthing.
+
+    REST-first: a single PUT creates the folder with type already set to
+    send-receive; the two-subprocess CLI path is the fallback.
+    """
+    body = {
+        "id": folder_id,
+        "path": str(path),
+        "type": "sendreceive",
+    }
+    if api_put(f"/rest/config/folders/{folder_id}", body):
+        _invalidate_config_cache()
+        return True
+
     result = run_syncthing_cli(
         "config", "folders", "add",
         "--id", folder_id,
@@ -109,36 +174,153 @@ def add_folder(folder_id: str, path: Path) -> bool:
     # Set folder type to send-receive
     run_syncthing_cli("config", "folders", folder_id, "type", "set", "sendreceive")
 
+    _invalidate_config_cache()
     return True
 
 
 def add_device(device_id: str, name: str | None = None) -> bool:
     """Add a device to Syncthing."""
+    body = {"deviceID": device_id}
+    if name:
+        body["name"] = name
+    if api_put(f"/rest/config/devices/{device_id}", body):
+        _invalidate_config_cache()
+        return True
+
     args = ["config", "devices", "add", "--device-id", device_id]
     if name:
         args.extend(["--name", name])
 
     result = run_syncthing_cli(*args)
+    _invalidate_config_cache()
     return result.returncode == 0
 
 
 def set_device_address(device_id: str, address: str) -> bool:
     """Set the address for a device (e.g., tcp://100.x.y.z:22000)."""
+    device = api_get(f"/rest/config/devices/{device_id}")
+    if device is not None:
+        device["addresses"] = [address]
+        if api_put(f"/rest/config/devices/{device_id}", device):
+            _invalidate_config_cache()
+            return True
+
     result = run_syncthing_cli(
         "config", "devices", device_id, "addresses", "set", address
     )
+    _invalidate_config_cache()
     return result.returncode == 0
 
 
-def add_device_to_folder(folder_id: str, device_id: str) -> bool:
-    """Add a device to a folder's sharing list."""
+def apply_config_batch(
+    folders: list[dict] | None = None,
+    devices: list[dict] | None = None,
+    folder_devices: dict[str, list[str]] | None = None,
+) -> bool:
+    """Apply several config additions in one full-config round-trip.
+
+    GETs /rest/config, merges new folder/device objects and any folder
+    sharing entries, and PUTs the document back once — N mutations cost
+    two REST calls instead of N. Entries already present are skipped.
+
+    Args:
+        folders: Folder config objects to add
+        devices: Device config objects to add
+        folder_devices: Device IDs to share each folder ID with
+    """
+    config = api_get("/rest/config")
+    if config is None:
+        return False
+
+    if devices:
+        existing_ids = {d.get("deviceID") for d in config.get("devices", [])}
+        config.setdefault("devices", []).extend(
+            d for d in devices if d.get("deviceID") not in existing_ids
+        )
+    if folders:
+        existing_ids = {f.get("id") for f in config.get("folders", [])}
+        config.setdefault("folders", []).extend(
+            f for f in folders if f.get("id") not in existing_ids
+        )
+    if folder_devices:
+        by_id = {f.get("id"): f for f in config.get("folders", [])}
+        for folder_id, device_ids in folder_devices.items():
+            folder = by_id.get(folder_id)
+            if folder is None:
+                continue
+            shared = {d.get("deviceID") for d in folder.get("devices", [])}
+            folder.setdefault("devices", []).extend(
+                {"deviceID": d} for d in device_ids if d and d not in shared
+            )
+
+    if api_put("/rest/config", config):
+        _invalidate_config_cache()
+        return True
+    return False
+
+
+def pair_device(device_id: str, name: str | None, address: str) -> bool:
+    """Add a new device with its address set, in one config update.
+
+    Collapses the add_device + set_device_address sequence into a single
+    REST PUT; falls back to the two separate operations when the API is
+    unreachable. Meant for devices not yet in the config — the PUT
+    replaces any existing device object wholesale.
+    """
+    body = {"deviceID": device_id, "addresses": [address]}
+    if name:
+        body["name"] = name
+    if api_put(f"/rest/config/devices/{device_id}", body):
+        _invalidate_config_cache()
+        return True
+
+    if not add_device(device_id, name):
+        return False
+    return set_device_address(device_id, address)
+
+
+def _cli_add_device_to_folder(folder_id: str, device_id: str) -> bool:
+    """CLI fallback for sharing a folder with a device."""
     result = run_syncthing_cli(
         "config", "folders", folder_id, "devices", "add",
         "--device-id", device_id
     )
+    _invalidate_config_cache()
     return result.returncode == 0
 
 
+def add_device_to_folder(folder_id: str, device_id: str) -> bool:
+    """Add a device to a folder's sharing list."""
+    return add_devices_to_folder(folder_id, [device_id])
+
+
+def add_devices_to_folder(folder_id: str, device_ids: list[str]) -> bool:
+    """Share a folder with several devices in one config update.
+
+    Uses a single REST PUT when the API is reachable, so N devices cost
+    two round-trips instead of N. Falls back to one CLI call per device.
+    """
+    device_ids = [d for d in device_ids if d]
+    if not device_ids:
+        return True
+
+    folder = api_get(f"/rest/config/folders/{folder_id}")
+    if folder is not None:
+        existing = {d.get("deviceID") for d in folder.get("devices", [])}
+        new = [d for d in device_ids if d not in existing]
+        if not new:
+            return True
+        folder.setdefault("devices", []).extend({"deviceID": d} for d in new)
+        if api_put(f"/rest/config/folders/{folder_id}", folder):
+            _invalidate_config_cache()
+            return True
+
+    ok = True
+    for device_id in device_ids:
+        ok = _cli_add_device_to_folder(folder_id, device_id) and ok
+    return ok
+
+
 def get_folder_status(folder_id: str) -> dict | None:
     """Get the status of a folder."""
     return api_get(f"/rest/db/status?folder={folder_id}")
@@ -150,7 +332,7 @@ def get_connections() -> dict:
     if result.returncode != 0:
         return {}
 
-    return json.loads(result.stdout)
+    return _loads(result.stdout)
 
 
 def get_gui_address() -> str | None:
@@ -170,51 +352,125 @@ def is_gui_localhost_only() -> bool:
     address = get_gui_address()
     if not address:
         return True
-    host = address.split(":")[0] if ":" in address else address
-    return host in ("127.0.0.1", "localhost", "::1")
+    # urlsplit handles bracketed IPv6 literals like [::1]:8384, which a
+    # naive split(":") would mangle
+    try:
+        host = urllib.parse.urlsplit(f"//{address}").hostname
+    except ValueError:
+        return False
+    if not host:
+        return True
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
 
 
+@functools.lru_cache(maxsize=1)
 def get_api_key() -> str | None:
-    """Get the local Syncthing API key."""
+    """Get the local Syncthing API key (constant per process, so cached)."""
     result = run_syncthing_cli("config", "gui", "apikey", "get")
     return result.stdout.strip() if result.returncode == 0 else None
 
 
+def invalidate_api_key() -> None:
+    """Drop the cached API key (e.g., after rotating it via the GUI)."""
+    get_api_key.cache_clear()
+
+
+# The scheme that last worked against localhost:8384; once known, the
+# losing scheme (usually a doomed TLS handshake) is never attempted again
+_api_scheme: str | None = None
+
+
+def _api_schemes() -> tuple[str, ...]:
+    """Schemes to try, with the known-good one (if any) pinned first."""
+    if _api_scheme is not None:
+        return (_api_scheme,)
+    # Try HTTPS first, then fall back to HTTP (default is HTTP unless TLS is enabled)
+    return ("https", "http")
+
+
 def api_get(endpoint: str) -> dict | None:
     """Query local Syncthing REST API."""
-    import httpx
-
+    global _api_scheme
     api_key = get_api_key()
     if not api_key:
         return None
 
     headers = {"X-API-Key": api_key}
+    client = _get_api_client()
 
-    # Try HTTPS first, then fall back to HTTP (default is HTTP unless TLS is enabled)
-    for scheme in ("https", "http"):
+    for scheme in _api_schemes():
         url = f"{scheme}://localhost:8384{endpoint}"
         try:
-            with httpx.Client(timeout=5.0, verify=False) as client:
-                response = client.get(url, headers=headers, follow_redirects=True)
-                if response.status_code == 200:
-                    return response.json()
+            response = client.get(url, headers=headers)
+            if response.status_code == 200:
+                _api_scheme = scheme
+                return _loads(response.content)
         except Exception:
             continue
     return None
 
 
+def api_put(endpoint: str, body: dict | list) -> bool:
+    """Send a PUT with a JSON body to the local Syncthing REST API."""
+    global _api_scheme
+    api_key = get_api_key()
+    if not api_key:
+        return False
+
+    headers = {"X-API-Key": api_key}
+    client = _get_api_client()
+
+    for scheme in _api_schemes():
+        url = f"{scheme}://localhost:8384{endpoint}"
+        try:
+            response = client.put(url, headers=headers, json=body)
+            if response.status_code < 300:
+                _api_scheme = scheme
+                return True
+        except Exception:
+            continue
+    return False
+
+
 def get_device_stats() -> dict:
     """Get per-device statistics."""
     return api_get("/rest/stats/device") or {}
 
 
+@functools.lru_cache(maxsize=1)
+def get_full_config() -> dict | None:
+    """Get the complete Syncthing config (devices, folders, gui, options).
+
+    One REST call serves both get_config_devices and get_config_folders;
+    the snapshot is cached for the process and dropped after config
+    mutations via _invalidate_config_cache.
+    """
+    return api_get("/rest/config")
+
+
+def _invalidate_config_cache() -> None:
+    """Drop the cached config snapshot after a config mutation."""
+    get_full_config.cache_clear()
+
+
 def get_config_devices() -> list[dict]:
     """Get full device configuration (with names and addresses)."""
+    config = get_full_config()
+    if config is not None:
+        return config.get("devices") or []
     return api_get("/rest/config/devices") or []
 
 
 def get_config_folders() -> list[dict]:
     """Get full folder configuration."""
+    config = get_full_config()
+    if config is not None:
+        return config.get("folders") or []
     return api_get("/rest/config/folders") or []
 
 
@@ -228,6 +484,39 @@ def get_pending_devices() -> dict:
     return api_get("/rest/cluster/pending/devices") or {}
 
 
+@dataclass(slots=True)
+class StatusBundle:
+    """Snapshot of everything a status view reads from Syncthing."""
+
+    system_status: dict | None
+    config_devices: list[dict]
+    connections: dict
+    device_stats: dict
+    config_folders: list[dict]
+    pending_devices: dict
+
+
+def fetch_status_bundle() -> StatusBundle:
+    """Fetch the six independent status reads concurrently.
+
+    Each read is its own REST round-trip (the subprocess fallback
+    releases the GIL too), so the bundle arrives after the slowest call
+    instead of the sum of all six.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        futures = (
+            executor.submit(get_system_status),
+            executor.submit(get_config_devices),
+            executor.submit(get_connections),
+            executor.submit(get_device_stats),
+            executor.submit(get_config_folders),
+            executor.submit(get_pending_devices),
+        )
+    return StatusBundle(*(f.result() for f in futures))
+
+
 def get_syncthing_version() -> str | None:
     """Get the Syncthing version string."""
     # Try REST API first (more reliable if running)
@@ -259,9 +548,13 @@ def is_syncthing_running() -> bool:
     return status is not None
 
 
+@functools.lru_cache(maxsize=1)
 def get_service_status() -> dict:
     """Get Syncthing service/autostart status.
 
+    Autostart config doesn't change while the CLI runs, so the result is
+    cached; the probes behind it shell out to launchctl/systemctl.
+
     Returns a dict with:
         - enabled: bool | None - Whether autostart is enabled
         - method: str | None - How it's configured (launchd, systemd, etc.)
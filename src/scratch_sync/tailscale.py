@@ -1,34 +1,91 @@
 """Tailscale CLI interactions."""
 
+import functools
 import json
+import re
 import shutil
 import subprocess
+import sys
+import time
+from collections.abc import Iterator
 from dataclasses import dataclass
 
+# Fixed argv tuples for the tailscale commands we run; on Windows,
+# CREATE_NO_WINDOW skips the console-window allocation on every spawn
+_TS_STATUS_JSON = ("tailscale", "status", "--json")
+_TS_STATUS = ("tailscale", "status")
+_TS_VERSION = ("tailscale", "version")
+_TS_IP4 = ("tailscale", "ip", "-4")
+_CREATIONFLAGS = subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
 
+# One parsed `tailscale status --json` snapshot shared by the accessors
+# below; a short TTL keeps a single UI refresh on one subprocess spawn
+_STATUS_CACHE: tuple[float, dict] | None = None
+
+
+def _get_status_json(ttl: float = 1.0, refresh: bool = False) -> dict | None:
+    """Get parsed `tailscale status --json` output, cached for `ttl` seconds.
+
+    Args:
+        ttl: Maximum age of a cached snapshot before refetching
+        refresh: Force a fresh fetch regardless of cache age
+
+    Returns:
+        The parsed status dict, or None if tailscale is missing or errored
+    """
+    global _STATUS_CACHE
+    now = time.monotonic()
+    if not refresh and _STATUS_CACHE is not None and now - _STATUS_CACHE[0] < ttl:
+        return _STATUS_CACHE[1]
+
+    try:
+        # No text=True: json.loads takes the stdout bytes directly, which
+        # skips a decode pass over what can be tens of KB on big tailnets
+        result = subprocess.run(
+            _TS_STATUS_JSON,
+            capture_output=True,
+            creationflags=_CREATIONFLAGS,
+        )
+        if result.returncode != 0:
+            return None
+        data = json.loads(result.stdout)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+    _STATUS_CACHE = (now, data)
+    return data
+
+
+@functools.lru_cache(maxsize=1)
 def find_tailscale() -> str | None:
-    """Find tailscale binary in PATH."""
+    """Find tailscale binary in PATH (cached; PATH is stable per process)."""
     return shutil.which("tailscale")
 
 
+# Matches the leading version token of "1.76.6\n  tailscale commit: ..."
+_TS_VERSION_RE = re.compile(rb"^(\S+)")
+
+
+@functools.lru_cache(maxsize=1)
 def get_tailscale_version() -> str | None:
-    """Get the Tailscale version string."""
+    """Get the Tailscale version string (cached; can't change mid-process)."""
     try:
         result = subprocess.run(
-            ["tailscale", "version"],
+            _TS_VERSION,
             capture_output=True,
-            text=True,
+            creationflags=_CREATIONFLAGS,
         )
         if result.returncode == 0:
             # Output is like "1.76.6\n  tailscale commit: ..."
-            version_line = result.stdout.strip().split("\n")[0]
-            return version_line.strip()
+            match = _TS_VERSION_RE.match(result.stdout)
+            if match:
+                return match.group(1).decode()
     except FileNotFoundError:
         pass
     return None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TailnetInfo:
     """Information about the current Tailscale connection."""
 
@@ -42,37 +99,29 @@ class TailnetInfo:
 
 def get_tailnet_info() -> TailnetInfo | None:
     """Get information about the current Tailscale tailnet and user."""
-    try:
-        result = subprocess.run(
-            ["tailscale", "status", "--json"],
-            capture_output=True,
-            text=True,
-        )
-        if result.returncode != 0:
-            return None
-
-        data = json.loads(result.stdout)
-        self_info = data.get("Self", {})
-        user_info = data.get("User", {})
-        current_tailnet = data.get("CurrentTailnet", {})
-
-        # Get user info from the User dict using Self's UserID
-        user_id = str(self_info.get("UserID", ""))
-        user_data = user_info.get(user_id, {})
-
-        return TailnetInfo(
-            tailnet_name=current_tailnet.get("Name"),
-            user_login=user_data.get("LoginName"),
-            user_name=user_data.get("DisplayName"),
-            dns_name=self_info.get("DNSName", "").rstrip("."),
-            hostname=self_info.get("HostName"),
-            backend_state=data.get("BackendState"),
-        )
-    except (FileNotFoundError, json.JSONDecodeError):
+    data = _get_status_json()
+    if data is None:
         return None
 
+    self_info = data.get("Self", {})
+    user_info = data.get("User", {})
+    current_tailnet = data.get("CurrentTailnet", {})
+
+    # Get user info from the User dict using Self's UserID
+    user_id = str(self_info.get("UserID", ""))
+    user_data = user_info.get(user_id, {})
+
+    return TailnetInfo(
+        tailnet_name=current_tailnet.get("Name"),
+        user_login=user_data.get("LoginName"),
+        user_name=user_data.get("DisplayName"),
+        dns_name=self_info.get("DNSName", "").rstrip("."),
+        hostname=self_info.get("HostName"),
+        backend_state=data.get("BackendState"),
+    )
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class TailscalePeer:
     """A peer on the Tailscale network."""
 
@@ -86,10 +135,12 @@ class TailscalePeer:
 def is_tailscale_running() -> bool:
     """Check if Tailscale is running."""
     try:
+        # Only the exit code matters; skip the pipe allocations entirely
         result = subprocess.run(
-            ["tailscale", "status"],
-            capture_output=True,
-            text=True,
+            _TS_STATUS,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            creationflags=_CREATIONFLAGS,
         )
         return result.returncode == 0
     except FileNotFoundError:
@@ -100,9 +151,11 @@ def get_tailscale_ip() -> str | None:
     """Get the local Tailscale IP address."""
     try:
         result = subprocess.run(
-            ["tailscale", "ip", "-4"],
-            capture_output=True,
+            _TS_IP4,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             text=True,
+            creationflags=_CREATIONFLAGS,
         )
         if result.returncode == 0:
             return result.stdout.strip()
@@ -113,78 +166,48 @@ def get_tailscale_ip() -> str | None:
 
 def get_hostname() -> str | None:
     """Get the local Tailscale hostname."""
-    try:
-        result = subprocess.run(
-            ["tailscale", "status", "--json"],
-            capture_output=True,
-            text=True,
+    data = _get_status_json()
+    if data is None:
+        return None
+    return data.get("Self", {}).get("HostName")
+
+
+def iter_peers(online_only: bool = False) -> Iterator[TailscalePeer]:
+    """Yield peers from the shared status snapshot, one at a time.
+
+    Args:
+        online_only: Skip peers that are currently offline
+    """
+    data = _get_status_json()
+    if data is None:
+        return
+
+    for peer in data.get("Peer", {}).values():
+        online = peer.get("Online", False)
+        if online_only and not online:
+            continue
+        yield TailscalePeer(
+            hostname=peer.get("HostName", "unknown"),
+            tailscale_ip=peer.get("TailscaleIPs", [None])[0],
+            os=peer.get("OS", "unknown"),
+            online=online,
+            node_id=peer.get("ID"),
         )
-        if result.returncode == 0:
-            data = json.loads(result.stdout)
-            return data.get("Self", {}).get("HostName")
-    except (FileNotFoundError, json.JSONDecodeError):
-        pass
-    return None
 
 
 def get_online_peers() -> list[TailscalePeer]:
     """Get all online peers on the Tailscale network."""
-    try:
-        result = subprocess.run(
-            ["tailscale", "status", "--json"],
-            capture_output=True,
-            text=True,
-        )
-        if result.returncode != 0:
-            return []
-
-        data = json.loads(result.stdout)
-        peers = []
-
-        for peer in data.get("Peer", {}).values():
-            if peer.get("Online"):
-                peers.append(
-                    TailscalePeer(
-                        hostname=peer.get("HostName", "unknown"),
-                        tailscale_ip=peer.get("TailscaleIPs", [None])[0],
-                        os=peer.get("OS", "unknown"),
-                        online=True,
-                        node_id=peer.get("ID"),
-                    )
-                )
-
-        return peers
-
-    except (FileNotFoundError, json.JSONDecodeError):
-        return []
+    return list(iter_peers(online_only=True))
 
 
 def get_all_peers() -> list[TailscalePeer]:
     """Get all peers on the Tailscale network (including offline)."""
-    try:
-        result = subprocess.run(
-            ["tailscale", "status", "--json"],
-            capture_output=True,
-            text=True,
-        )
-        if result.returncode != 0:
-            return []
+    return list(iter_peers())
 
-        data = json.loads(result.stdout)
-        peers = []
-
-        for peer in data.get("Peer", {}).values():
-            peers.append(
-                TailscalePeer(
-                    hostname=peer.get("HostName", "unknown"),
-                    tailscale_ip=peer.get("TailscaleIPs", [None])[0],
-                    os=peer.get("OS", "unknown"),
-                    online=peer.get("Online", False),
-                    node_id=peer.get("ID"),
-                )
-            )
 
-        return peers
-
-    except (FileNotFoundError, json.JSONDecodeError):
-        return []
+def count_online_peers() -> int:
+    """Count online peers without building TailscalePeer objects."""
+    data = _get_status_json()
+    if data is None:
+        return 0
+    return sum(1 for peer in data.get("Peer", {}).values() if peer.get("Online"))
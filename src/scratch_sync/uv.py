@@ -1,16 +1,23 @@
 """uv package manager CLI interactions."""
 
+import functools
+import re
 import shutil
 import subprocess
 
+# Matches the version token in "uv 0.5.14 (...)" straight off the stdout bytes
+_UV_VERSION_RE = re.compile(rb"^uv\s+(\S+)")
 
+
+@functools.lru_cache(maxsize=1)
 def find_uv() -> str | None:
-    """Find uv binary in PATH."""
+    """Find uv binary in PATH (cached; PATH is stable per process)."""
     return shutil.which("uv")
 
 
+@functools.lru_cache(maxsize=1)
 def get_uv_version() -> str | None:
-    """Get the uv version string."""
+    """Get the uv version string (cached; can't change mid-process)."""
     binary = find_uv()
     if not binary:
         return None
@@ -19,16 +26,13 @@ def get_uv_version() -> str | None:
         result = subprocess.run(
             [binary, "--version"],
             capture_output=True,
-            text=True,
         )
         if result.returncode == 0:
             # Output is like "uv 0.5.14 (..."
-            version_line = result.stdout.strip().split("\n")[0]
-            # Extract just the version number
-            parts = version_line.split()
-            if len(parts) >= 2:
-                return parts[1]  # e.g., "0.5.14"
-            return version_line
+            match = _UV_VERSION_RE.match(result.stdout)
+            if match:
+                return match.group(1).decode()  # e.g., "0.5.14"
+            return result.stdout.strip().decode(errors="replace")
     except Exception:
         pass
     return None